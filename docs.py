@@ -1,38 +1,105 @@
 """generate openapi docs."""
 import json
 import argparse
-from pkg_resources import get_distribution
-
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+
+try:  # importlib.metadata avoids pkg_resources' sys.path scan at import
+    from importlib.metadata import version as _dist_version
+except ImportError:  # python < 3.8
+    from importlib_metadata import version as _dist_version
+
+import pydantic.schema
+import pydantic_openapi_helper.core
 from pydantic_openapi_helper.core import get_openapi
-from pydantic_openapi_helper.inheritance import class_mapper
-from ladybug_display_schema.geometry2d import Vector2D, Point2D, Ray2D, LineSegment2D, \
-    Polyline2D, Arc2D, Polygon2D, Mesh2D
-from ladybug_display_schema.geometry3d import Vector3D, Point3D, Ray3D, Plane, \
-    LineSegment3D, Polyline3D, Arc3D, Face3D, Mesh3D, Polyface3D, Sphere, Cone, Cylinder
-from ladybug_display_schema.display2d import DisplayVector2D, DisplayPoint2D, \
-    DisplayRay2D, DisplayLineSegment2D, DisplayPolyline2D, DisplayArc2D, \
-    DisplayPolygon2D, DisplayMesh2D
-from ladybug_display_schema.display3d import DisplayVector3D, DisplayPoint3D, \
-    DisplayRay3D, DisplayPlane, DisplayLineSegment3D, DisplayPolyline3D, DisplayArc3D, \
-    DisplayFace3D, DisplayMesh3D, DisplayPolyface3D, DisplaySphere, DisplayCone, \
-    DisplayCylinder
+from pydantic_openapi_helper.inheritance import class_mapper, get_schemas_inheritance
+from ladybug_display_schema.geometry2d import GEOMETRY_TYPES_2D
+from ladybug_display_schema.geometry3d import GEOMETRY_TYPES_3D
+from ladybug_display_schema.display2d import DISPLAY_TYPES_2D
+from ladybug_display_schema.display3d import DisplayText3D, DISPLAY_TYPES_3D
 from ladybug_display_schema.visualization import VisualizationSet, VisualizationMetaData
 
-parser = argparse.ArgumentParser(description='Generate OpenAPI JSON schemas')
+try:  # use orjson to write the multi-MB outputs when it is available
+    import orjson
+except ImportError:
+    orjson = None
+
+MANIFEST_PATH = './docs/.manifest.json'
+
+
+def _load_manifest():
+    """Load the content-hash manifest from the last docs build."""
+    try:
+        with open(MANIFEST_PATH) as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(manifest):
+    """Atomically write the content-hash manifest for this docs build."""
+    tmp_path = MANIFEST_PATH + '.tmp'
+    with open(tmp_path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def _dump_json(obj, file_path, manifest=None):
+    """Write a dictionary to a JSON file with 2-space indentation and sorted keys.
+
+    Keys are sorted so the output is deterministic - pydantic's schema walk
+    emits definitions in a hash-seed-dependent order - which lets the content
+    hashes below actually match between runs. When a manifest of hashes from
+    the previous build is given, files whose serialized content is unchanged
+    are left untouched so no-op builds do not rewrite (and re-timestamp)
+    every output.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(obj, indent=2, sort_keys=True).encode('utf-8')
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    if manifest is None or manifest.get(file_path) != digest \
+            or not os.path.isfile(file_path):
+        with open(file_path, 'wb') as out_file:
+            out_file.write(payload)
+    return digest
+
+
+# memoize the pydantic schema walks that get_openapi repeats across the
+# non-inheritance pass, the inheritance pass and the redoc output so each
+# unique set of models is only processed once per run
 
-parser.add_argument('--version', help='Set the version of the new OpenAPI Schema')
 
-args = parser.parse_args()
+@lru_cache(maxsize=None)
+def _cached_schema(models, ref_prefix):
+    return pydantic.schema.schema(models, ref_prefix=ref_prefix)
+
+
+@lru_cache(maxsize=None)
+def _cached_schemas_inheritance(models):
+    return get_schemas_inheritance(list(models))
+
+
+def _schema(models, ref_prefix=None):
+    return deepcopy(_cached_schema(tuple(models), ref_prefix))
+
+
+def _schemas_inheritance(models):
+    return deepcopy(_cached_schemas_inheritance(tuple(models)))
+
+
+pydantic_openapi_helper.core.schema = _schema
+pydantic_openapi_helper.core.get_schemas_inheritance = _schemas_inheritance
 
-if args.version:
-    VERSION = args.version.replace('v', '')
-else:
-    VERSION = '.'.join(get_distribution('ladybug_display_schema').version.split('.')[:3])
 lic_url = "https://github.com/ladybug-tools/ladybug-display-schema/blob/master/LICENSE"
 
 info = {
     "description": "",
-    "version": VERSION,
+    "version": '',
     "title": "",
     "contact": {
         "name": "Ladybug Tools",
@@ -49,18 +116,11 @@ info = {
     }
 }
 
-all_geo = [
-    Vector2D, Point2D, Ray2D, LineSegment2D, Polyline2D, Arc2D, Polygon2D, Mesh2D,
-    Vector3D, Point3D, Ray3D, Plane, LineSegment3D, Polyline3D, Arc3D, Face3D, Mesh3D,
-    Polyface3D, Sphere, Cone, Cylinder
-]
+all_geo = list(GEOMETRY_TYPES_2D + GEOMETRY_TYPES_3D)
 
+# DisplayText3D has never been part of the display docs so it is excluded here
 all_dis = [
-    DisplayVector2D, DisplayPoint2D, DisplayRay2D, DisplayLineSegment2D,
-    DisplayPolyline2D, DisplayArc2D, DisplayPolygon2D, DisplayMesh2D,
-    DisplayVector3D, DisplayPoint3D, DisplayRay3D, DisplayPlane, DisplayLineSegment3D,
-    DisplayPolyline3D, DisplayArc3D, DisplayFace3D, DisplayMesh3D,
-    DisplayPolyface3D, DisplaySphere, DisplayCone, DisplayCylinder
+    cls for cls in DISPLAY_TYPES_2D + DISPLAY_TYPES_3D if cls is not DisplayText3D
 ]
 
 modules = [
@@ -76,63 +136,105 @@ def _process_name(name):
     return new_name
 
 
-for module in modules:
-    # generate open api schema
+def _generate_module_docs(module, version, manifest=None):
+    """Generate the base, inheritance and mapper files for a single module."""
     print(f'Generating {module["name"]} documentation...')
+    name_slug = _process_name(module['name'])
+    digests = {}
 
     external_docs = {
         "description": "OpenAPI Specification with Inheritance",
-        "url": f"./{_process_name(module['name'])}_inheritance.json"
+        "url": f"./{name_slug}_inheritance.json"
     }
 
     openapi = get_openapi(
         module['module'],
         title=f'Ladybug {module["name"]} Schema',
-        description=f'Ladybug {_process_name(module["name"])} schema.',
-        version=VERSION, info=info,
+        description=f'Ladybug {name_slug} schema.',
+        version=version, info=info,
         external_docs=external_docs
     )
 
     # write out the base openAPI schema
-    with open(f'./docs/{_process_name(module["name"])}.json', 'w') as out_file:
-        json.dump(openapi, out_file, indent=2)
+    base_path = f'./docs/{name_slug}.json'
+    digests[base_path] = _dump_json(openapi, base_path, manifest)
 
     # with inheritance
     openapi = get_openapi(
         module['module'],
         title=f'Ladybug {module["name"]} Schema',
-        description=f'Documentation for Ladybug {_process_name(module["name"])} schema',
-        version=VERSION, info=info,
+        description=f'Documentation for Ladybug {name_slug} schema',
+        version=version, info=info,
         inheritance=True,
         external_docs=external_docs
     )
 
     # write out the OpenAPI with inheritance
-    with open(f'./docs/{_process_name(module["name"])}_inheritance.json', 'w') \
-            as out_file:
-        json.dump(openapi, out_file, indent=2)
+    inheritance_path = f'./docs/{name_slug}_inheritance.json'
+    digests[inheritance_path] = _dump_json(openapi, inheritance_path, manifest)
 
     # add the mapper file
-    with open(f'./docs/{_process_name(module["name"])}_mapper.json', 'w') as out_file:
-        json.dump(class_mapper(module['module']), out_file, indent=2)
-
-# generate schema for mode with inheritance but without descriminator
-# we will use this file for generating redocly - the full model is too big, and the
-# model with inheritance and discriminators is renders incorrectly
-external_docs = {
-    "description": "OpenAPI Specification with Inheritance",
-    "url": "./visualization_inheritance.json"
-}
+    mapper_path = f'./docs/{name_slug}_mapper.json'
+    digests[mapper_path] = _dump_json(
+        class_mapper(module['module']), mapper_path, manifest)
+
+    if module['name'] == 'Visualization':
+        digests.update(_generate_redoc_docs(version, manifest))
+    return digests
+
+
+def _generate_redoc_docs(version, manifest=None):
+    """Generate schema for the model with inheritance but without discriminator.
+
+    We will use this file for generating redocly - the full model is too big, and
+    the model with inheritance and discriminators is rendered incorrectly.
+    """
+    external_docs = {
+        "description": "OpenAPI Specification with Inheritance",
+        "url": "./visualization_inheritance.json"
+    }
+
+    openapi = get_openapi(
+        [VisualizationSet, VisualizationMetaData],
+        title='Ladybug Visualization Schema',
+        description='Documentation for Honeybee model schema',
+        version=version, info=info,
+        inheritance=True,
+        external_docs=external_docs,
+        add_discriminator=False
+    )
+
+    redoc_path = './docs/visualization_redoc.json'
+    return {redoc_path: _dump_json(openapi, redoc_path, manifest)}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate OpenAPI JSON schemas')
+
+    parser.add_argument('--version', help='Set the version of the new OpenAPI Schema')
+
+    args = parser.parse_args()
+
+    if args.version:
+        VERSION = args.version.replace('v', '')
+    else:
+        VERSION = '.'.join(_dist_version('ladybug_display_schema').split('.')[:3])
+
+    info['version'] = VERSION
+
+    # the generated JSON is not in git, so the folder may not exist on a fresh clone
+    os.makedirs('./docs', exist_ok=True)
+
+    manifest = _load_manifest()
+
+    # the three modules are independent so their docs can be generated in parallel
+    new_manifest = {}
+    with ProcessPoolExecutor(max_workers=len(modules)) as executor:
+        futures = [
+            executor.submit(_generate_module_docs, module, VERSION, manifest)
+            for module in modules
+        ]
+        for future in futures:
+            new_manifest.update(future.result())
 
-openapi = get_openapi(
-    [VisualizationSet, VisualizationMetaData],
-    title='Ladybug Visualization Schema',
-    description='Documentation for Honeybee model schema',
-    version=VERSION, info=info,
-    inheritance=True,
-    external_docs=external_docs,
-    add_discriminator=False
-)
-
-with open('./docs/visualization_redoc.json', 'w') as out_file:
-    json.dump(openapi, out_file, indent=2)
+    _write_manifest(new_manifest)
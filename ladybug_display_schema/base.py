@@ -1,20 +1,157 @@
 """Base class for all objects requiring a valid names for all engines."""
+import sys
 from enum import Enum
 from typing import Union
-from pydantic import BaseModel, Field, Extra, constr
+from typing_extensions import Literal
+from pydantic import BaseModel, Field, Extra
+from pydantic.fields import SHAPE_LIST
+from pydantic.validators import str_validator
+
+try:  # parse JSON payloads with orjson when it is available
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+def _hydrate_trusted(field, value):
+    """Rebuild the nested models within a trusted value without validation."""
+    if value is None:
+        return None
+    if field.shape == SHAPE_LIST and field.sub_fields:
+        item_field = field.sub_fields[0]
+        return [_hydrate_trusted(item_field, item) for item in value]
+    if field.sub_fields and isinstance(value, dict) and 'type' in value:
+        # a Union field - dispatch on the type tag of the value
+        for member in field.sub_fields:
+            member_type = member.type_
+            if isinstance(member_type, type) and issubclass(member_type, BaseModel) \
+                    and member_type.__fields__['type'].default == value['type']:
+                return member_type.from_trusted_dict(value)
+        return value
+    field_type = field.type_
+    if isinstance(field_type, type):
+        if issubclass(field_type, BaseModel) and isinstance(value, dict):
+            return field_type.from_trusted_dict(value)
+        if issubclass(field_type, Enum):
+            return field_type(value)
+    return value
+
+
+SCHEMA_REGISTRY = {}
+"""Map from the type tag of every schema class in this package to the class.
+
+The map is filled automatically as classes are defined, giving consumers O(1)
+dispatch from a serialized type string to the class that parses it without
+maintaining the table by hand.
+"""
 
 
 class NoExtraBaseModel(BaseModel):
     """Base class for all objects that are not extensible with additional keys."""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        type_field = cls.__fields__.get('type')
+        if type_field is not None and isinstance(type_field.default, str):
+            # interned tags make the registry and discriminator lookups
+            # hit CPython's pointer-equality fast path
+            SCHEMA_REGISTRY[sys.intern(type_field.default)] = cls
+
     class Config:
         extra = Extra.forbid
+        # reuse already-validated submodels instead of copying them per parent
+        copy_on_model_validation = 'none'
+        json_loads = staticmethod(_json_loads)
+
+    @classmethod
+    def from_trusted_dict(cls, data):
+        """Recursively build an instance from a trusted dictionary without validation.
+
+        This is intended for dictionaries that round-trip this package's own
+        serialized output (eg. geometry passed through a subprocess), where
+        re-running every validator on data the library just produced is
+        wasted work. No checks are performed, so invalid input produces
+        invalid model objects.
+        """
+        values = {}
+        for name, field in cls.__fields__.items():
+            if name in data:
+                values[name] = _hydrate_trusted(field, data[name])
+            else:
+                values[name] = field.get_default()
+        return cls.construct(_fields_set=set(data), **values)
+
+    @classmethod
+    def from_trusted_file(cls, file_path):
+        """Build an instance from a trusted JSON file without validation.
+
+        This reads the file as bytes and routes it through from_trusted_dict,
+        so it carries the same contract: the file must round-trip this
+        package's own serialized output, as no checks are performed.
+        """
+        with open(file_path, 'rb') as json_file:
+            data = _json_loads(json_file.read())
+        return cls.from_trusted_dict(data)
+
+
+class UserData(dict):
+    """Dictionary of user data that is stored by reference without deep validation."""
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value):
+        if not isinstance(value, dict):
+            raise TypeError('user_data must be a dictionary.')
+        return value
+
+    @classmethod
+    def __modify_schema__(cls, field_schema):
+        field_schema['type'] = 'object'
+
+
+class InternedStr(str):
+    """A string type whose validated values are interned.
+
+    Fields like font, unit and display_name repeat the same few strings
+    across thousands of objects. Interning collapses the duplicates that
+    each JSON parse would otherwise allocate into one shared instance and
+    makes equality checks in downstream grouping code pointer comparisons.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield str_validator
+        yield cls._intern
+
+    @classmethod
+    def _intern(cls, value):
+        return sys.intern(value)
+
+
+USER_DATA_FIELD = Field(
+    default=None,
+    description='Optional dictionary of user data associated with the object.'
+    'All keys and values of this dictionary should be of a standard data '
+    'type to ensure correct serialization of the object (eg. str, float, '
+    'int, list).'
+)
+"""Shared field definition for all user_data fields."""
 
 
 class Color(NoExtraBaseModel):
     """A RGB color."""
 
-    type: constr(regex='^Color$') = 'Color'
+    class Config:
+        # colors are immutable so they can be hashed, interned and shared
+        allow_mutation = False
+
+    def __hash__(self):
+        return hash((self.r, self.g, self.b, self.a))
+
+    type: Literal['Color'] = 'Color'
 
     r: int = Field(
         ...,
@@ -46,10 +183,71 @@ class Color(NoExtraBaseModel):
     )
 
 
+MESH_COLORS_FIELD = Field(
+    None,
+    description='An optional list of colors that correspond to either the faces '
+    'of the mesh or the vertices of the mesh.'
+)
+"""Shared field definition for all mesh colors fields."""
+
+
+def coerce_color_sequences(value):
+    """Convert (r, g, b) or (r, g, b, a) sequences in a colors list to Colors.
+
+    The channel values are checked inline - two comparisons per channel -
+    so the Colors can be built with Color.construct, skipping the per-field
+    pydantic machinery that would otherwise run for every vertex of a large
+    mesh. Dictionaries and Color objects pass through to the usual validation.
+    """
+    if not isinstance(value, (list, tuple)) or not any(
+            isinstance(item, (list, tuple)) for item in value):
+        return value
+    colors = []
+    for item in value:
+        if isinstance(item, (list, tuple)):
+            if len(item) not in (3, 4):
+                raise ValueError(
+                    'Color sequences must have 3 or 4 values for (r, g, b) '
+                    f'or (r, g, b, a). Got {len(item)} values.'
+                )
+            for channel in item:
+                if not isinstance(channel, int) or isinstance(channel, bool):
+                    raise ValueError(
+                        f'Color channel values must be integers. Got {channel!r}.'
+                    )
+                if not 0 <= channel <= 255:
+                    raise ValueError(
+                        f'Color channel values must be between 0 and 255. '
+                        f'Got {channel}.'
+                    )
+            a = item[3] if len(item) > 3 else 255
+            item = Color.construct(r=item[0], g=item[1], b=item[2], a=a)
+        colors.append(item)
+    return colors
+
+
+def intern_colors(colors):
+    """Replace duplicate Colors in a list with a single shared instance.
+
+    Mesh colors typically draw from a small palette (legend segments), so a
+    mesh with a million faces usually holds only a few hundred unique colors.
+    Sharing one instance per unique (r, g, b, a) cuts the memory of large
+    color lists by orders of magnitude.
+    """
+    if not colors:
+        return colors
+    pool = {}
+    return [pool.setdefault((c.r, c.g, c.b, c.a), c) for c in colors]
+
+
 class Default(NoExtraBaseModel):
     """Object to signify when the default value of a visual interface should be used."""
 
-    type: constr(regex='^Default$') = 'Default'
+    type: Literal['Default'] = 'Default'
+
+
+DEFAULT = Default()
+"""Shared sentinel instance used as the default for all defaultable fields."""
 
 
 class LineTypes(str, Enum):
@@ -66,6 +264,14 @@ class DisplayModes(str, Enum):
     points = 'Points'
 
 
+DISPLAY_MODE_FIELD = Field(
+    DisplayModes.surface,
+    description='Text to indicate the display mode (surface, wireframe, '
+    'etc.). The DisplayModes enumeration contains all acceptable types.'
+)
+"""Shared field definition for all display_mode fields."""
+
+
 class HorizontalAlignments(str, Enum):
     left = 'Left'
     center = 'Center'
@@ -81,13 +287,7 @@ class VerticalAlignments(str, Enum):
 class DisplayBaseModel(NoExtraBaseModel):
     """Base class for all Geometric Display objects."""
 
-    user_data: dict = Field(
-        default=None,
-        description='Optional dictionary of user data associated with the object.'
-        'All keys and values of this dictionary should be of a standard data '
-        'type to ensure correct serialization of the object (eg. str, float, '
-        'int, list).'
-    )
+    user_data: UserData = USER_DATA_FIELD
 
 
 class SingleColorBase(DisplayBaseModel):
@@ -102,8 +302,8 @@ class SingleColorBase(DisplayBaseModel):
 class LineCurveBase(SingleColorBase):
     """Base class for all Geometric Display objects with a line like properties."""
 
-    line_width: Union[Default, float] = Field(
-        Default(),
+    line_width: Union[float, Default] = Field(
+        DEFAULT,
         ge=0,
         description='Number for line width in pixels (for the screen) or '
         'millimeters (in print). Set to zero to hide the geometry.'
@@ -1,8 +1,11 @@
 """Schemas for geometric display objects in 2D space."""
+from types import MappingProxyType
 from typing import Union
-from pydantic import Field, constr
+from typing_extensions import Annotated, Literal
+from pydantic import Field
 
-from .base import SingleColorBase, LineCurveBase, DisplayModes, Default
+from .base import SingleColorBase, LineCurveBase, DisplayModes, \
+    DISPLAY_MODE_FIELD, Default, DEFAULT
 from .geometry2d import Vector2D, Point2D, Ray2D, LineSegment2D, \
     Polyline2D, Arc2D, Polygon2D, Mesh2D
 
@@ -10,7 +13,7 @@ from .geometry2d import Vector2D, Point2D, Ray2D, LineSegment2D, \
 class DisplayVector2D(SingleColorBase):
     """A point object in 2D space with display properties."""
 
-    type: constr(regex='^DisplayVector2D$') = 'DisplayVector2D'
+    type: Literal['DisplayVector2D'] = 'DisplayVector2D'
 
     geometry: Vector2D = Field(
         ...,
@@ -21,15 +24,15 @@ class DisplayVector2D(SingleColorBase):
 class DisplayPoint2D(SingleColorBase):
     """A point object in 2D space with display properties."""
 
-    type: constr(regex='^DisplayPoint2D$') = 'DisplayPoint2D'
+    type: Literal['DisplayPoint2D'] = 'DisplayPoint2D'
 
     geometry: Point2D = Field(
         ...,
         description='Point2D for the geometry.'
     )
 
-    radius: Union[Default, float] = Field(
-        Default(),
+    radius: Union[float, Default] = Field(
+        DEFAULT,
         ge=0,
         description='Number for the radius with which the point should be displayed '
         'in pixels (for the screen) or millimeters (in print).'
@@ -39,7 +42,7 @@ class DisplayPoint2D(SingleColorBase):
 class DisplayRay2D(SingleColorBase):
     """A ray object in 2D space with display properties."""
 
-    type: constr(regex='^DisplayRay2D$') = 'DisplayRay2D'
+    type: Literal['DisplayRay2D'] = 'DisplayRay2D'
 
     geometry: Ray2D = Field(
         ...,
@@ -50,7 +53,7 @@ class DisplayRay2D(SingleColorBase):
 class DisplayLineSegment2D(LineCurveBase):
     """A single line segment face in 2D space with display properties."""
 
-    type: constr(regex='^DisplayLineSegment2D$') = 'DisplayLineSegment2D'
+    type: Literal['DisplayLineSegment2D'] = 'DisplayLineSegment2D'
 
     geometry: LineSegment2D = Field(
         ...,
@@ -61,7 +64,7 @@ class DisplayLineSegment2D(LineCurveBase):
 class DisplayPolyline2D(LineCurveBase):
     """A polyline in 2D space with display properties."""
 
-    type: constr(regex='^DisplayPolyline2D$') = 'DisplayPolyline2D'
+    type: Literal['DisplayPolyline2D'] = 'DisplayPolyline2D'
 
     geometry: Polyline2D = Field(
         ...,
@@ -72,7 +75,7 @@ class DisplayPolyline2D(LineCurveBase):
 class DisplayArc2D(LineCurveBase):
     """A single arc or circle in 2D space with display properties."""
 
-    type: constr(regex='^DisplayArc2D$') = 'DisplayArc2D'
+    type: Literal['DisplayArc2D'] = 'DisplayArc2D'
 
     geometry: Arc2D = Field(
         ...,
@@ -83,7 +86,7 @@ class DisplayArc2D(LineCurveBase):
 class DisplayPolygon2D(LineCurveBase):
     """A single polygon in 2D space with display properties."""
 
-    type: constr(regex='^DisplayPolygon2D$') = 'DisplayPolygon2D'
+    type: Literal['DisplayPolygon2D'] = 'DisplayPolygon2D'
 
     geometry: Polygon2D = Field(
         ...,
@@ -94,15 +97,24 @@ class DisplayPolygon2D(LineCurveBase):
 class DisplayMesh2D(SingleColorBase):
     """A mesh in 2D space with display properties."""
 
-    type: constr(regex='^DisplayMesh2D$') = 'DisplayMesh2D'
+    type: Literal['DisplayMesh2D'] = 'DisplayMesh2D'
 
     geometry: Mesh2D = Field(
         ...,
         description='Mesh2D for the geometry.'
     )
 
-    display_mode: DisplayModes = Field(
-        DisplayModes.surface,
-        description='Text to indicate the display mode (surface, wireframe, '
-        'etc.). The DisplayModes enumeration contains all acceptable types.'
-    )
+    display_mode: DisplayModes = DISPLAY_MODE_FIELD
+
+
+DISPLAY_TYPES_2D = (
+    DisplayVector2D, DisplayPoint2D, DisplayRay2D, DisplayLineSegment2D,
+    DisplayPolyline2D, DisplayArc2D, DisplayPolygon2D, DisplayMesh2D
+)
+"""Tuple of all display object classes in 2D space."""
+
+DISPLAY_TYPE_MAP_2D = MappingProxyType({cls.__name__: cls for cls in DISPLAY_TYPES_2D})
+"""Immutable map from the type tag of each 2D display object to its class."""
+
+DISPLAY_UNION_2D = Annotated[Union[DISPLAY_TYPES_2D], Field(discriminator='type')]
+"""Union of all display objects in 2D space, discriminated by the type tag."""
@@ -1,9 +1,12 @@
 """Schemas for geometric display objects in 3D space."""
+from types import MappingProxyType
 from typing import Union
-from pydantic import Field, constr
+from typing_extensions import Annotated, Literal
+from pydantic import Field
 
 from .base import SingleColorBase, LineCurveBase, DisplayModes, \
-    HorizontalAlignments, VerticalAlignments, Default
+    DISPLAY_MODE_FIELD, HorizontalAlignments, VerticalAlignments, Default, \
+    DEFAULT, InternedStr
 from .geometry3d import Vector3D, Point3D, Ray3D, Plane, LineSegment3D, \
     Polyline3D, Arc3D, Face3D, Mesh3D, Polyface3D, Sphere, Cone, Cylinder
 
@@ -11,7 +14,7 @@ from .geometry3d import Vector3D, Point3D, Ray3D, Plane, LineSegment3D, \
 class DisplayVector3D(SingleColorBase):
     """A point object in 3D space with display properties."""
 
-    type: constr(regex='^DisplayVector3D$') = 'DisplayVector3D'
+    type: Literal['DisplayVector3D'] = 'DisplayVector3D'
 
     geometry: Vector3D = Field(
         ...,
@@ -22,15 +25,15 @@ class DisplayVector3D(SingleColorBase):
 class DisplayPoint3D(SingleColorBase):
     """A point object in 3D space with display properties."""
 
-    type: constr(regex='^DisplayPoint3D$') = 'DisplayPoint3D'
+    type: Literal['DisplayPoint3D'] = 'DisplayPoint3D'
 
     geometry: Point3D = Field(
         ...,
         description='Point3D for the geometry.'
     )
 
-    radius: Union[Default, float] = Field(
-        Default(),
+    radius: Union[float, Default] = Field(
+        DEFAULT,
         ge=0,
         description='Number for the radius with which the point should be displayed '
         'in pixels (for the screen) or millimeters (in print).'
@@ -40,7 +43,7 @@ class DisplayPoint3D(SingleColorBase):
 class DisplayRay3D(SingleColorBase):
     """A ray object in 3D space with display properties."""
 
-    type: constr(regex='^DisplayRay3D$') = 'DisplayRay3D'
+    type: Literal['DisplayRay3D'] = 'DisplayRay3D'
 
     geometry: Ray3D = Field(
         ...,
@@ -51,7 +54,7 @@ class DisplayRay3D(SingleColorBase):
 class DisplayPlane(SingleColorBase):
     """A plane object with display properties."""
 
-    type: constr(regex='^DisplayPlane$') = 'DisplayPlane'
+    type: Literal['DisplayPlane'] = 'DisplayPlane'
 
     geometry: Plane = Field(
         ...,
@@ -74,7 +77,7 @@ class DisplayPlane(SingleColorBase):
 class DisplayLineSegment3D(LineCurveBase):
     """A single line segment face in 3D space with display properties."""
 
-    type: constr(regex='^DisplayLineSegment3D$') = 'DisplayLineSegment3D'
+    type: Literal['DisplayLineSegment3D'] = 'DisplayLineSegment3D'
 
     geometry: LineSegment3D = Field(
         ...,
@@ -85,7 +88,7 @@ class DisplayLineSegment3D(LineCurveBase):
 class DisplayPolyline3D(LineCurveBase):
     """A polyline in 3D space with display properties."""
 
-    type: constr(regex='^DisplayPolyline3D$') = 'DisplayPolyline3D'
+    type: Literal['DisplayPolyline3D'] = 'DisplayPolyline3D'
 
     geometry: Polyline3D = Field(
         ...,
@@ -96,7 +99,7 @@ class DisplayPolyline3D(LineCurveBase):
 class DisplayArc3D(LineCurveBase):
     """A single arc or circle in 3D space with display properties."""
 
-    type: constr(regex='^DisplayArc3D$') = 'DisplayArc3D'
+    type: Literal['DisplayArc3D'] = 'DisplayArc3D'
 
     geometry: Arc3D = Field(
         ...,
@@ -107,109 +110,85 @@ class DisplayArc3D(LineCurveBase):
 class DisplayFace3D(SingleColorBase):
     """A single planar face in 3D space with display properties."""
 
-    type: constr(regex='^DisplayFace3D$') = 'DisplayFace3D'
+    type: Literal['DisplayFace3D'] = 'DisplayFace3D'
 
     geometry: Face3D = Field(
         ...,
         description='Face3D for the geometry.'
     )
 
-    display_mode: DisplayModes = Field(
-        DisplayModes.surface,
-        description='Text to indicate the display mode (surface, wireframe, '
-        'etc.). The DisplayModes enumeration contains all acceptable types.'
-    )
+    display_mode: DisplayModes = DISPLAY_MODE_FIELD
 
 
 class DisplayMesh3D(SingleColorBase):
     """A mesh in 3D space with display properties."""
 
-    type: constr(regex='^DisplayMesh3D$') = 'DisplayMesh3D'
+    type: Literal['DisplayMesh3D'] = 'DisplayMesh3D'
 
     geometry: Mesh3D = Field(
         ...,
         description='Mesh3D for the geometry.'
     )
 
-    display_mode: DisplayModes = Field(
-        DisplayModes.surface,
-        description='Text to indicate the display mode (surface, wireframe, '
-        'etc.). The DisplayModes enumeration contains all acceptable types.'
-    )
+    display_mode: DisplayModes = DISPLAY_MODE_FIELD
 
 
 class DisplayPolyface3D(SingleColorBase):
     """A Polyface in 3D space with display properties."""
 
-    type: constr(regex='^DisplayPolyface3D$') = 'DisplayPolyface3D'
+    type: Literal['DisplayPolyface3D'] = 'DisplayPolyface3D'
 
     geometry: Polyface3D = Field(
         ...,
         description='Polyface3D for the geometry.'
     )
 
-    display_mode: DisplayModes = Field(
-        DisplayModes.surface,
-        description='Text to indicate the display mode (surface, wireframe, '
-        'etc.). The DisplayModes enumeration contains all acceptable types.'
-    )
+    display_mode: DisplayModes = DISPLAY_MODE_FIELD
 
 
 class DisplaySphere(SingleColorBase):
     """A sphere object with display properties."""
 
-    type: constr(regex='^DisplaySphere$') = 'DisplaySphere'
+    type: Literal['DisplaySphere'] = 'DisplaySphere'
 
     geometry: Sphere = Field(
         ...,
         description='Sphere for the geometry.'
     )
 
-    display_mode: DisplayModes = Field(
-        DisplayModes.surface,
-        description='Text to indicate the display mode (surface, wireframe, '
-        'etc.). The DisplayModes enumeration contains all acceptable types.'
-    )
+    display_mode: DisplayModes = DISPLAY_MODE_FIELD
 
 
 class DisplayCone(SingleColorBase):
     """A cone object with display properties."""
 
-    type: constr(regex='^DisplayCone$') = 'DisplayCone'
+    type: Literal['DisplayCone'] = 'DisplayCone'
 
     geometry: Cone = Field(
         ...,
         description='Cone for the geometry.'
     )
 
-    display_mode: DisplayModes = Field(
-        DisplayModes.surface,
-        description='Text to indicate the display mode (surface, wireframe, '
-        'etc.). The DisplayModes enumeration contains all acceptable types.'
-    )
+    display_mode: DisplayModes = DISPLAY_MODE_FIELD
 
 
 class DisplayCylinder(SingleColorBase):
     """A cylinder object with display properties."""
 
-    type: constr(regex='^DisplayCylinder$') = 'DisplayCylinder'
+    type: Literal['DisplayCylinder'] = 'DisplayCylinder'
 
     geometry: Cylinder = Field(
         ...,
         description='Cylinder for the geometry.'
     )
 
-    display_mode: DisplayModes = Field(
-        DisplayModes.surface,
-        description='Text to indicate the display mode (surface, wireframe, '
-        'etc.). The DisplayModes enumeration contains all acceptable types.'
-    )
+    display_mode: DisplayModes = DISPLAY_MODE_FIELD
 
 
 class DisplayText3D(SingleColorBase):
     """A text object in 3D space with display properties."""
 
-    type: constr(regex='^DisplayText3D$') = 'DisplayText3D'
+    type: Literal['DisplayText3D'] = 'DisplayText3D'
 
     text: str = Field(
         ...,
@@ -228,7 +207,7 @@ class DisplayText3D(SingleColorBase):
         description='A number for the height of the text in the 3D scene.'
     )
 
-    font: str = Field(
+    font: InternedStr = Field(
         'Arial',
         description='A text string for the font in which to draw the text. '
         'Note that this field may not be interpreted the same on all machines and '
@@ -244,3 +223,18 @@ class DisplayText3D(SingleColorBase):
         VerticalAlignments.bottom,
         description='String to specify the vertical alignment of the text.'
     )
+
+
+DISPLAY_TYPES_3D = (
+    DisplayVector3D, DisplayPoint3D, DisplayRay3D, DisplayPlane,
+    DisplayLineSegment3D, DisplayPolyline3D, DisplayArc3D, DisplayFace3D,
+    DisplayMesh3D, DisplayPolyface3D, DisplaySphere, DisplayCone,
+    DisplayCylinder, DisplayText3D
+)
+"""Tuple of all display object classes in 3D space."""
+
+DISPLAY_TYPE_MAP_3D = MappingProxyType({cls.__name__: cls for cls in DISPLAY_TYPES_3D})
+"""Immutable map from the type tag of each 3D display object to its class."""
+
+DISPLAY_UNION_3D = Annotated[Union[DISPLAY_TYPES_3D], Field(discriminator='type')]
+"""Union of all display objects in 3D space, discriminated by the type tag."""
@@ -1,15 +1,23 @@
 """Schemas for geometry objects in 2D space."""
 import math
-from typing import List
-from pydantic import Field, conlist, constr, conint
+from typing import List, Union
+from typing_extensions import Annotated, Literal
+from pydantic import Field, conlist, conint, validator
 
-from .base import NoExtraBaseModel, Color
+from .base import NoExtraBaseModel, Color, MESH_COLORS_FIELD, \
+    coerce_color_sequences, intern_colors
+
+_TAU = math.pi * 2  # full-circle angle used by the arc domain bounds
+
+# shared constrained types so repeated shapes compile to one class per module
+_COORDS_2D = conlist(float, min_items=2, max_items=2)
+_FACE_INDICES = conlist(conint(ge=0), min_items=3, max_items=4)
 
 
 class Vector2D(NoExtraBaseModel):
     """A vector object in 2D space."""
 
-    type: constr(regex='^Vector2D$') = 'Vector2D'
+    type: Literal['Vector2D'] = 'Vector2D'
 
     x: float = Field(
         ...,
@@ -25,7 +33,7 @@ class Vector2D(NoExtraBaseModel):
 class Point2D(NoExtraBaseModel):
     """A point object in 2D space."""
 
-    type: constr(regex='^Point2D$') = 'Point2D'
+    type: Literal['Point2D'] = 'Point2D'
 
     x: float = Field(
         ...,
@@ -41,7 +49,7 @@ class Point2D(NoExtraBaseModel):
 class Ray2D(NoExtraBaseModel):
     """A ray object in 2D space."""
 
-    type: constr(regex='^Ray2D$') = 'Ray2D'
+    type: Literal['Ray2D'] = 'Ray2D'
 
     p: List[float] = Field(
         ...,
@@ -61,7 +69,7 @@ class Ray2D(NoExtraBaseModel):
 class LineSegment2D(NoExtraBaseModel):
     """A single line segment face in 2D space."""
 
-    type: constr(regex='^LineSegment2D$') = 'LineSegment2D'
+    type: Literal['LineSegment2D'] = 'LineSegment2D'
 
     p: List[float] = Field(
         ...,
@@ -81,9 +89,9 @@ class LineSegment2D(NoExtraBaseModel):
 class Polyline2D(NoExtraBaseModel):
     """A polyline in 2D space."""
 
-    type: constr(regex='^Polyline2D$') = 'Polyline2D'
+    type: Literal['Polyline2D'] = 'Polyline2D'
 
-    vertices: List[conlist(float, min_items=2, max_items=2)] = Field(
+    vertices: List[_COORDS_2D] = Field(
         ...,
         min_items=3,
         description='A list of points representing the the vertices of the polyline. '
@@ -101,7 +109,7 @@ class Polyline2D(NoExtraBaseModel):
 class Arc2D(NoExtraBaseModel):
     """A single arc or circle in 2D space."""
 
-    type: constr(regex='^Arc2D$') = 'Arc2D'
+    type: Literal['Arc2D'] = 'Arc2D'
 
     c: List[float] = Field(
         ...,
@@ -118,14 +126,14 @@ class Arc2D(NoExtraBaseModel):
     a1: float = Field(
         default=0,
         ge=0,
-        le=math.pi * 2,
+        le=_TAU,
         description='A number between 0 and 2 * pi for the start angle of the arc.'
     )
 
     a2: float = Field(
-        default=math.pi * 2,
+        default=_TAU,
         ge=0,
-        le=math.pi * 2,
+        le=_TAU,
         description='A number between 0 and 2 * pi for the end angle of the arc.'
     )
 
@@ -133,9 +141,9 @@ class Arc2D(NoExtraBaseModel):
 class Polygon2D(NoExtraBaseModel):
     """A polygon in 2D space (without holes)."""
 
-    type: constr(regex='^Polygon2D$') = 'Polygon2D'
+    type: Literal['Polygon2D'] = 'Polygon2D'
 
-    vertices: List[conlist(float, min_items=2, max_items=2)] = Field(
+    vertices: List[_COORDS_2D] = Field(
         ...,
         min_items=3,
         description='A list of points representing the vertices of the polygon. '
@@ -147,9 +155,9 @@ class Polygon2D(NoExtraBaseModel):
 class Mesh2D(NoExtraBaseModel):
     """A mesh in 2D space."""
 
-    type: constr(regex='^Mesh2D$') = 'Mesh2D'
+    type: Literal['Mesh2D'] = 'Mesh2D'
 
-    vertices: List[conlist(float, min_items=2, max_items=2)] = Field(
+    vertices: List[_COORDS_2D] = Field(
         ...,
         min_items=3,
         description='A list of points representing the vertices of the mesh. '
@@ -157,15 +165,30 @@ class Mesh2D(NoExtraBaseModel):
         'should be a list of 2 (x, y) values.'
     )
 
-    faces: List[conlist(conint(ge=0), min_items=3, max_items=4)] = Field(
+    faces: List[_FACE_INDICES] = Field(
         ...,
         min_items=1,
         description='A list of lists with each sub-list having either 3 or 4 '
         'integers. These integers correspond to indices within the list of vertices.'
     )
 
-    colors: List[Color] = Field(
-        None,
-        description='An optional list of colors that correspond to either the faces '
-        'of the mesh or the vertices of the mesh.'
-    )
+    colors: List[Color] = MESH_COLORS_FIELD
+
+    @validator('colors', pre=True)
+    def coerce_colors(cls, value):
+        """Accept (r, g, b) or (r, g, b, a) sequences in place of Color objects."""
+        return coerce_color_sequences(value)
+
+    @validator('colors')
+    def dedupe_colors(cls, value):
+        """Share a single Color instance across duplicate colors in the list."""
+        return intern_colors(value)
+
+
+GEOMETRY_TYPES_2D = (
+    Vector2D, Point2D, Ray2D, LineSegment2D, Polyline2D, Arc2D, Polygon2D, Mesh2D
+)
+"""Tuple of all geometry object classes in 2D space."""
+
+GEOMETRY_UNION_2D = Annotated[Union[GEOMETRY_TYPES_2D], Field(discriminator='type')]
+"""Union of all geometry objects in 2D space, discriminated by the type tag."""
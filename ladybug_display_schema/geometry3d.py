@@ -1,15 +1,24 @@
 """Schemas for geometry objects in 3D space."""
 import math
-from typing import List
-from pydantic import Field, conlist, constr, conint
+from typing import List, Union
+from typing_extensions import Annotated, Literal
+from pydantic import Field, conlist, conint, validator
 
-from .base import NoExtraBaseModel, Color
+from .base import NoExtraBaseModel, Color, MESH_COLORS_FIELD, \
+    coerce_color_sequences, intern_colors
+
+_TAU = math.pi * 2  # full-circle angle used by the arc domain bounds
+
+# shared constrained types so repeated shapes compile to one class per module
+_COORDS_3D = conlist(float, min_items=3, max_items=3)
+_FACE_INDICES = conlist(conint(ge=0), min_items=3, max_items=4)
+_EDGE_INDICES = conlist(conint(ge=0), min_items=2, max_items=2)
 
 
 class Vector3D(NoExtraBaseModel):
     """A vector object in 3D space."""
 
-    type: constr(regex='^Vector3D$') = 'Vector3D'
+    type: Literal['Vector3D'] = 'Vector3D'
 
     x: float = Field(
         ...,
@@ -30,7 +39,7 @@ class Vector3D(NoExtraBaseModel):
 class Point3D(NoExtraBaseModel):
     """A point object in 3D space."""
 
-    type: constr(regex='^Point3D$') = 'Point3D'
+    type: Literal['Point3D'] = 'Point3D'
 
     x: float = Field(
         ...,
@@ -51,7 +60,7 @@ class Point3D(NoExtraBaseModel):
 class Ray3D(NoExtraBaseModel):
     """A ray object in 3D space."""
 
-    type: constr(regex='^Ray3D$') = 'Ray3D'
+    type: Literal['Ray3D'] = 'Ray3D'
 
     p: List[float] = Field(
         ...,
@@ -71,7 +80,7 @@ class Ray3D(NoExtraBaseModel):
 class Plane(NoExtraBaseModel):
     """A plane object."""
 
-    type: constr(regex='^Plane$') = 'Plane'
+    type: Literal['Plane'] = 'Plane'
 
     n: List[float] = Field(
         ...,
@@ -98,7 +107,7 @@ class Plane(NoExtraBaseModel):
 class LineSegment3D(NoExtraBaseModel):
     """A single line segment face in 3D space."""
 
-    type: constr(regex='^LineSegment3D$') = 'LineSegment3D'
+    type: Literal['LineSegment3D'] = 'LineSegment3D'
 
     p: List[float] = Field(
         ...,
@@ -118,9 +127,9 @@ class LineSegment3D(NoExtraBaseModel):
 class Polyline3D(NoExtraBaseModel):
     """A polyline in 3D space."""
 
-    type: constr(regex='^Polyline3D$') = 'Polyline3D'
+    type: Literal['Polyline3D'] = 'Polyline3D'
 
-    vertices: List[conlist(float, min_items=3, max_items=3)] = Field(
+    vertices: List[_COORDS_3D] = Field(
         ...,
         min_items=3,
         description='A list of points representing the the vertices of the polyline. '
@@ -138,7 +147,7 @@ class Polyline3D(NoExtraBaseModel):
 class Arc3D(NoExtraBaseModel):
     """A single arc or circle in 3D space."""
 
-    type: constr(regex='^Arc3D$') = 'Arc3D'
+    type: Literal['Arc3D'] = 'Arc3D'
 
     plane: Plane = Field(
         ...,
@@ -154,14 +163,14 @@ class Arc3D(NoExtraBaseModel):
     a1: float = Field(
         default=0,
         ge=0,
-        le=math.pi * 2,
+        le=_TAU,
         description='A number between 0 and 2 * pi for the start angle of the arc.'
     )
 
     a2: float = Field(
-        default=math.pi * 2,
+        default=_TAU,
         ge=0,
-        le=math.pi * 2,
+        le=_TAU,
         description='A number between 0 and 2 * pi for the end angle of the arc.'
     )
 
@@ -169,9 +178,9 @@ class Arc3D(NoExtraBaseModel):
 class Face3D(NoExtraBaseModel):
     """A single planar face in 3D space."""
 
-    type: constr(regex='^Face3D$') = 'Face3D'
+    type: Literal['Face3D'] = 'Face3D'
 
-    boundary: List[conlist(float, min_items=3, max_items=3)] = Field(
+    boundary: List[_COORDS_3D] = Field(
         ...,
         min_items=3,
         description='A list of points representing the outer boundary vertices of '
@@ -179,7 +188,7 @@ class Face3D(NoExtraBaseModel):
         'should be a list of 3 (x, y, z) values.'
     )
 
-    holes: List[conlist(conlist(float, min_items=3, max_items=3), min_items=3)] = Field(
+    holes: List[conlist(_COORDS_3D, min_items=3)] = Field(
         default=None,
         description='Optional list of lists with one list for each hole in the face.'
         'Each hole should be a list of at least 3 points and each point a list '
@@ -197,9 +206,9 @@ class Face3D(NoExtraBaseModel):
 class Mesh3D(NoExtraBaseModel):
     """A mesh in 3D space."""
 
-    type: constr(regex='^Mesh3D$') = 'Mesh3D'
+    type: Literal['Mesh3D'] = 'Mesh3D'
 
-    vertices: List[conlist(float, min_items=3, max_items=3)] = Field(
+    vertices: List[_COORDS_3D] = Field(
         ...,
         min_items=3,
         description='A list of points representing the vertices of the mesh. '
@@ -207,24 +216,30 @@ class Mesh3D(NoExtraBaseModel):
         'should be a list of 3 (x, y, z) values.'
     )
 
-    faces: List[conlist(conint(ge=0), min_items=3, max_items=4)] = Field(
+    faces: List[_FACE_INDICES] = Field(
         ...,
         min_items=1,
         description='A list of lists with each sub-list having either 3 or 4 '
         'integers. These integers correspond to indices within the list of vertices.'
     )
 
-    colors: List[Color] = Field(
-        None,
-        description='An optional list of colors that correspond to either the faces '
-        'of the mesh or the vertices of the mesh.'
-    )
+    colors: List[Color] = MESH_COLORS_FIELD
+
+    @validator('colors', pre=True)
+    def coerce_colors(cls, value):
+        """Accept (r, g, b) or (r, g, b, a) sequences in place of Color objects."""
+        return coerce_color_sequences(value)
+
+    @validator('colors')
+    def dedupe_colors(cls, value):
+        """Share a single Color instance across duplicate colors in the list."""
+        return intern_colors(value)
 
 
 class PolyfaceEdgeInfo(NoExtraBaseModel):
     """Optional edge information for Polyface."""
 
-    edge_indices: List[conlist(conint(ge=0), min_items=2, max_items=2)] = Field(
+    edge_indices: List[_EDGE_INDICES] = Field(
         ...,
         min_items=3,
         description='An array objects that each contain two integers. These integers '
@@ -244,9 +259,9 @@ class PolyfaceEdgeInfo(NoExtraBaseModel):
 class Polyface3D(NoExtraBaseModel):
     """A Polyface in 3D space."""
 
-    type: constr(regex='^Polyface3D$') = 'Polyface3D'
+    type: Literal['Polyface3D'] = 'Polyface3D'
 
-    vertices: List[conlist(float, min_items=3, max_items=3)] = Field(
+    vertices: List[_COORDS_3D] = Field(
         ...,
         min_items=3,
         description='A list of points representing the vertices of the polyface. '
@@ -278,7 +293,7 @@ class Polyface3D(NoExtraBaseModel):
 class Sphere(NoExtraBaseModel):
     """A sphere object."""
 
-    type: constr(regex='^Sphere$') = 'Sphere'
+    type: Literal['Sphere'] = 'Sphere'
 
     center: List[float] = Field(
         ...,
@@ -297,7 +312,7 @@ class Sphere(NoExtraBaseModel):
 class Cone(NoExtraBaseModel):
     """A cone object."""
 
-    type: constr(regex='^Cone$') = 'Cone'
+    type: Literal['Cone'] = 'Cone'
 
     vertex: List[float] = Field(
         ...,
@@ -326,7 +341,7 @@ class Cone(NoExtraBaseModel):
 class Cylinder(NoExtraBaseModel):
     """A cylinder object."""
 
-    type: constr(regex='^Cylinder$') = 'Cylinder'
+    type: Literal['Cylinder'] = 'Cylinder'
 
     center: List[float] = Field(
         ...,
@@ -350,3 +365,13 @@ class Cylinder(NoExtraBaseModel):
         gt=0,
         description='A number representing the radius of the cylinder.'
     )
+
+
+GEOMETRY_TYPES_3D = (
+    Vector3D, Point3D, Ray3D, Plane, LineSegment3D, Polyline3D, Arc3D, Face3D,
+    Mesh3D, Polyface3D, Sphere, Cone, Cylinder
+)
+"""Tuple of all geometry object classes in 3D space."""
+
+GEOMETRY_UNION_3D = Annotated[Union[GEOMETRY_TYPES_3D], Field(discriminator='type')]
+"""Union of all geometry objects in 3D space, discriminated by the type tag."""
@@ -1,38 +1,88 @@
 """VisualizationSet used to align geometry with data and get legends, titles, colors."""
+import sys
+import base64
+import struct
+from types import MappingProxyType
 from typing import List, Union
 from enum import Enum
-from pydantic import Field, constr, conint, root_validator
+from typing_extensions import Annotated, Literal
+from pydantic import Field, constr, conint, validator, root_validator
 
-from .base import DisplayModes, NoExtraBaseModel, Default, Color
+from .base import DisplayModes, DISPLAY_MODE_FIELD, NoExtraBaseModel, \
+    Default, DEFAULT, Color, UserData, USER_DATA_FIELD, InternedStr, \
+    coerce_color_sequences, intern_colors
 from .geometry2d import Vector2D, Point2D, Ray2D, LineSegment2D, \
-    Polyline2D, Arc2D, Polygon2D, Mesh2D
+    Polyline2D, Arc2D, Polygon2D, Mesh2D, GEOMETRY_TYPES_2D
 from .geometry3d import Vector3D, Point3D, Ray3D, Plane, LineSegment3D, \
-    Polyline3D, Arc3D, Face3D, Mesh3D, Polyface3D, Sphere, Cone, Cylinder
+    Polyline3D, Arc3D, Face3D, Mesh3D, Polyface3D, Sphere, Cone, Cylinder, \
+    GEOMETRY_TYPES_3D
 from .display2d import DisplayVector2D, DisplayPoint2D, \
     DisplayRay2D, DisplayLineSegment2D, DisplayPolyline2D, DisplayArc2D, \
-    DisplayPolygon2D, DisplayMesh2D
+    DisplayPolygon2D, DisplayMesh2D, DISPLAY_TYPES_2D
 from .display3d import DisplayVector3D, DisplayPoint3D, \
     DisplayRay3D, DisplayPlane, DisplayLineSegment3D, DisplayPolyline3D, DisplayArc3D, \
     DisplayFace3D, DisplayMesh3D, DisplayPolyface3D, DisplaySphere, DisplayCone, \
-    DisplayCylinder, DisplayText3D
+    DisplayCylinder, DisplayText3D, DISPLAY_TYPES_3D
 
-GEOMETRY_UNION = Union[
-    Vector2D, Point2D, Ray2D, LineSegment2D, Polyline2D, Arc2D, Polygon2D,
-    Mesh2D, Vector3D, Point3D, Ray3D, Plane, LineSegment3D,
-    Polyline3D, Arc3D, Face3D, Mesh3D, Polyface3D, Sphere, Cone, Cylinder
+# shared constrained types so repeated shapes compile to one class per module
+_POS_INT = conint(ge=1)
+_NON_NEG_INT = conint(ge=0)
+_PX_PCT_STR = constr(regex=r'^\d+(?:px|%)$')
+
+_MESH_TYPES = frozenset(('Mesh2D', 'Mesh3D'))
+"""Type tags of the geometry classes whose faces and vertices carry values."""
+
+GEOMETRY_UNION = Annotated[
+    Union[GEOMETRY_TYPES_2D + GEOMETRY_TYPES_3D], Field(discriminator='type')
 ]
-DISPLAY_UNION = Union[
-    DisplayVector2D, DisplayPoint2D, DisplayRay2D, DisplayLineSegment2D,
-    DisplayPolyline2D, DisplayArc2D, DisplayPolygon2D, DisplayMesh2D,
-    DisplayVector3D, DisplayPoint3D, DisplayRay3D, DisplayPlane, DisplayLineSegment3D,
-    DisplayPolyline3D, DisplayArc3D, DisplayFace3D, DisplayMesh3D,
-    DisplayPolyface3D, DisplaySphere, DisplayCone, DisplayCylinder, DisplayText3D
+DISPLAY_UNION = Annotated[
+    Union[DISPLAY_TYPES_2D + DISPLAY_TYPES_3D], Field(discriminator='type')
 ]
 
+GEOMETRY_TYPE_MAP = MappingProxyType({
+    cls.__fields__['type'].default: cls
+    for cls in GEOMETRY_TYPES_2D + GEOMETRY_TYPES_3D
+})
+"""Map from the type tag of every geometry class to the class."""
+
+DISPLAY_TYPE_MAP = MappingProxyType({
+    cls.__fields__['type'].default: cls
+    for cls in DISPLAY_TYPES_2D + DISPLAY_TYPES_3D
+})
+"""Map from the type tag of every display class to the class."""
+
+
+def parse_geometry(data):
+    """Parse a dictionary of any geometry object with O(1) dispatch on its type."""
+    try:
+        geo_class = GEOMETRY_TYPE_MAP[data['type']]
+    except KeyError:
+        raise ValueError(
+            'Unknown geometry type "{}". Choose from: {}.'.format(
+                data.get('type'), ', '.join(GEOMETRY_TYPE_MAP))
+        )
+    return geo_class.parse_obj(data)
+
+
+def parse_display(data):
+    """Parse a dictionary of any display object with O(1) dispatch on its type."""
+    try:
+        dis_class = DISPLAY_TYPE_MAP[data['type']]
+    except KeyError:
+        raise ValueError(
+            'Unknown display type "{}". Choose from: {}.'.format(
+                data.get('type'), ', '.join(DISPLAY_TYPE_MAP))
+        )
+    return dis_class.parse_obj(data)
+
 
 class Legend3DParameters(NoExtraBaseModel):
 
-    type: constr(regex='^Legend3DParameters$') = 'Legend3DParameters'
+    class Config:
+        # legend parameters are value objects that are never mutated after creation
+        allow_mutation = False
+
+    type: Literal['Legend3DParameters'] = 'Legend3DParameters'
 
     base_plane: Plane = Field(
         None,
@@ -44,24 +94,24 @@ class Legend3DParameters(NoExtraBaseModel):
         'horizontal legends.'
     )
 
-    segment_height: Union[Default, float] = Field(
-        Default(),
+    segment_height: Union[float, Default] = Field(
+        DEFAULT,
         description='A number to set the height for each of the legend segments. '
         'The default is 1 unless the legend is assigned to a specific geometry, '
         'in which case it is automatically set to a value on an appropriate scale '
         '(some fraction of the bounding box around the geometry).'
     )
 
-    segment_width: Union[Default, float] = Field(
-        Default(),
+    segment_width: Union[float, Default] = Field(
+        DEFAULT,
         description='A number to set the width for each of the legend segments. '
         'The default is 1 unless the legend is assigned to a specific geometry, '
         'in which case it is automatically set to a value on an appropriate scale '
         '(some fraction of the bounding box around the geometry).'
     )
 
-    text_height: Union[Default, float] = Field(
-        Default(),
+    text_height: Union[float, Default] = Field(
+        DEFAULT,
         description='A number to set the height for the legend text. Default is '
         '1/3 of the segment_height.'
     )
@@ -69,10 +119,14 @@ class Legend3DParameters(NoExtraBaseModel):
 
 class Legend2DParameters(NoExtraBaseModel):
 
-    type: constr(regex='^Legend2DParameters$') = 'Legend2DParameters'
+    class Config:
+        # legend parameters are value objects that are never mutated after creation
+        allow_mutation = False
 
-    origin_x: Union[Default, constr(regex=r'^\d*px|\d*%$')] = Field(
-        Default(),
+    type: Literal['Legend2DParameters'] = 'Legend2DParameters'
+
+    origin_x: Union[_PX_PCT_STR, Default] = Field(
+        DEFAULT,
         description='A text string to note the X coordinate of the base point from '
         'where the legend will be generated (assuming an origin in the upper-left '
         'corner of the viewport with higher positive values of X moving to the right). '
@@ -82,8 +136,8 @@ class Legend2DParameters(NoExtraBaseModel):
         'legend clearly visible on the viewport (usually 10px).'
     )
 
-    origin_y: Union[Default, constr(regex=r'^\d*px|\d*%$')] = Field(
-        Default(),
+    origin_y: Union[_PX_PCT_STR, Default] = Field(
+        DEFAULT,
         description='A text string to note the Y coordinate of the base point from '
         'where the legend will be generated (assuming an origin in the upper-left '
         'corner of the viewport with higher positive values of Y moving downward). '
@@ -93,8 +147,8 @@ class Legend2DParameters(NoExtraBaseModel):
         'the legend clearly visible on the viewport (usually 50px).'
     )
 
-    segment_height: Union[Default, constr(regex=r'^\d*px|\d*%$')] = Field(
-        Default(),
+    segment_height: Union[_PX_PCT_STR, Default] = Field(
+        DEFAULT,
         description='A text string to note the height for each of the legend '
         'segments. Text must be formatted as an integer followed by either "px" (to '
         'denote the number of viewport pixels) or "%" (to denote the percentage of the '
@@ -102,8 +156,8 @@ class Legend2DParameters(NoExtraBaseModel):
         'legends readable (25px for horizontal legends and 36px for vertical legends).'
     )
 
-    segment_width: Union[Default, constr(regex=r'^\d*px|\d*%$')] = Field(
-        Default(),
+    segment_width: Union[_PX_PCT_STR, Default] = Field(
+        DEFAULT,
         description='A text string to set the width for each of the legend segments. '
         'Text must be formatted as an integer followed by either "px" (to denote '
         'the number of viewport pixels) or "%" (to denote the percentage of the '
@@ -111,8 +165,8 @@ class Legend2DParameters(NoExtraBaseModel):
         'legends readable (36px for horizontal legends and 25px for vertical legends).'
     )
 
-    text_height: Union[Default, constr(regex=r'^\d*px|\d*%$')] = Field(
-        Default(),
+    text_height: Union[_PX_PCT_STR, Default] = Field(
+        DEFAULT,
         description='A text string to set the height for the legend text. '
         'Text must be formatted as an integer followed by either "px" (to denote '
         'the number of viewport pixels) or "%" (to denote the percentage of the '
@@ -124,22 +178,26 @@ class Legend2DParameters(NoExtraBaseModel):
 class LegendParameters(NoExtraBaseModel):
     """Legend parameters used to customize legends."""
 
-    type: constr(regex='^LegendParameters$') = 'LegendParameters'
+    class Config:
+        # legend parameters are value objects that are never mutated after creation
+        allow_mutation = False
+
+    type: Literal['LegendParameters'] = 'LegendParameters'
 
-    min: Union[Default, float] = Field(
-        Default(),
+    min: Union[float, Default] = Field(
+        DEFAULT,
         description='A number to set the lower boundary of the legend. If Default, the '
         'minimum of the values associated with the legend will be used.'
     )
 
-    max: Union[Default, float] = Field(
-        Default(),
+    max: Union[float, Default] = Field(
+        DEFAULT,
         description='A number to set the upper boundary of the legend. If Default, the '
         'maximum of the values associated with the legend will be used.'
     )
 
-    segment_count: Union[Default, conint(ge=1)] = Field(
-        Default(),
+    segment_count: Union[_POS_INT, Default] = Field(
+        DEFAULT,
         description='An integer representing the number of steps between '
         'the high and low boundary of the legend. The default is set to 11 '
         'or it will be equal to the number of items in the ordinal_dictionary. '
@@ -153,7 +211,17 @@ class LegendParameters(NoExtraBaseModel):
         description='An list of color objects. Default is the Ladybug original colorset.'
     )
 
-    title: str = Field(
+    @validator('colors', pre=True)
+    def coerce_colors(cls, value):
+        """Accept (r, g, b) or (r, g, b, a) sequences in place of Color objects."""
+        return coerce_color_sequences(value)
+
+    @validator('colors')
+    def dedupe_colors(cls, value):
+        """Share a single Color instance across duplicate colors in the list."""
+        return intern_colors(value)
+
+    title: InternedStr = Field(
         '',
         description='Text string for Legend title. Typically, the units of the data '
         'are used here but the type of data might also be used.'
@@ -175,7 +243,7 @@ class LegendParameters(NoExtraBaseModel):
         'include: {-1: "Cold", 0: "Neutral", 1: "Hot"}, {0: "False", 1: "True"}'
     )
 
-    decimal_count: conint(ge=0) = Field(
+    decimal_count: _NON_NEG_INT = Field(
         2,
         description='An an integer for the number of decimal places in the legend '
         'text. Note that this input has no bearing on the resulting legend '
@@ -194,7 +262,7 @@ class LegendParameters(NoExtraBaseModel):
         'horizontal (False).'
     )
 
-    font: str = Field(
+    font: InternedStr = Field(
         'Arial',
         description='Text string to set the font for the legend text. Examples '
         'include "Arial", "Times New Roman", "Courier". Note that this '
@@ -215,16 +283,26 @@ class LegendParameters(NoExtraBaseModel):
         'properties of the legend when it is rendered in the 2D plane of a screen.'
     )
 
-    user_data: dict = Field(
-        default=None,
-        description='Optional dictionary of user data associated with the object.'
-        'All keys and values of this dictionary should be of a standard data '
-        'type to ensure correct serialization of the object (eg. str, float, '
-        'int, list).'
-    )
+    user_data: UserData = USER_DATA_FIELD
 
 
 class DataTypes(str, Enum):
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls._validate_member
+
+    @classmethod
+    def _validate_member(cls, value):
+        # a direct map lookup skips the much slower EnumMeta.__call__ machinery
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            raise ValueError(
+                'value is not a valid enumeration member; permitted: {}'.format(
+                    ', '.join(repr(member.value) for member in cls))
+            )
+
     activity_level = 'ActivityLevel'
     aerosol_optical_depth = 'AerosolOpticalDepth'
     air_speed = 'AirSpeed'
@@ -320,10 +398,19 @@ class DataTypes(str, Enum):
     zenith_luminance = 'ZenithLuminance'
 
 
+for _member in DataTypes:
+    # interned values keep _value2member_map_ lookups on the fast path
+    sys.intern(_member.value)
+
+
 class DataType(NoExtraBaseModel):
     """Data type representation."""
 
-    type: constr(regex='^DataType$') = 'DataType'
+    class Config:
+        # data types are value objects that are never mutated after creation
+        allow_mutation = False
+
+    type: Literal['DataType'] = 'DataType'
 
     data_type: DataTypes = Field(
         ...,
@@ -342,24 +429,24 @@ class DataType(NoExtraBaseModel):
 class GenericDataType(DataType):
     """Generic data type representation."""
 
-    type: constr(regex='^GenericDataType$') = 'GenericDataType'
+    type: Literal['GenericDataType'] = 'GenericDataType'
 
-    data_type: constr(regex='^GenericType$') = 'GenericType'
+    data_type: Literal['GenericType'] = 'GenericType'
 
-    base_unit: str = Field(
+    base_unit: InternedStr = Field(
         ...,
         description='Text string for the base unit of the data type, which '
         'should be standard SI units where possible.'
     )
 
-    min: Union[Default, float] = Field(
-        Default(),
+    min: Union[float, Default] = Field(
+        DEFAULT,
         description='Optional lower limit for the data type, values below which '
         'should be physically or mathematically impossible. (Default: -inf)'
     )
 
-    max: Union[Default, float] = Field(
-        Default(),
+    max: Union[float, Default] = Field(
+        DEFAULT,
         description='Optional upper limit for the data type, values above which '
         'should be physically or mathematically impossible. (Default: +inf)'
     )
@@ -395,15 +482,59 @@ class GenericDataType(DataType):
 class VisualizationData(NoExtraBaseModel):
     """Represents a data set for visualization with legend parameters and data type."""
 
-    type: constr(regex='^VisualizationData$') = 'VisualizationData'
+    type: Literal['VisualizationData'] = 'VisualizationData'
 
     values: List[float] = Field(
-        ...,
+        None,
         min_items=1,
         description='A list of numerical values that will be used to generate '
-        'the visualization colors.'
+        'the visualization colors. Exactly one of the values or the values_b64 '
+        'below must be specified; after de-serialization, the values are '
+        'always available here.'
     )
 
+    values_b64: str = Field(
+        None,
+        description='An optional base64 string of the values as packed '
+        'little-endian binary floats, which may be used in place of the values '
+        'above to shrink large payloads and skip JSON number parsing. When '
+        'specified, it is decoded into the values upon de-serialization.'
+    )
+
+    values_dtype: Literal['f4', 'f8'] = Field(
+        'f8',
+        description='Text for the binary float type used by values_b64. Choose '
+        'from f4 (32-bit floats) or f8 (64-bit floats). This input has no '
+        'effect when no values_b64 is specified.'
+    )
+
+    @root_validator(pre=True)
+    def decode_values_b64(cls, obj_props):
+        """Decode a base64 values payload into the values before validation."""
+        if not isinstance(obj_props, dict):
+            return obj_props
+        if obj_props.get('values_b64'):
+            if obj_props.get('values') is not None:
+                raise ValueError(
+                    'Only one of values and values_b64 may be specified.'
+                )
+            raw = base64.b64decode(obj_props['values_b64'])
+            fmt = 'f' if obj_props.get('values_dtype') == 'f4' else 'd'
+            item_size = struct.calcsize(fmt)
+            if len(raw) % item_size != 0:
+                raise ValueError(
+                    'values_b64 must decode to a multiple of '
+                    f'{item_size} bytes. Got {len(raw)} bytes.'
+                )
+            obj_props = dict(obj_props)
+            obj_props['values'] = list(
+                struct.unpack('<{}{}'.format(len(raw) // item_size, fmt), raw)
+            )
+            obj_props['values_b64'] = None  # avoid holding the payload twice
+        elif obj_props.get('values') is None:
+            raise ValueError('Either values or values_b64 must be specified.')
+        return obj_props
+
     legend_parameters: LegendParameters = Field(
         None,
         description='An Optional LegendParameters object to override default '
@@ -413,32 +544,27 @@ class VisualizationData(NoExtraBaseModel):
 
     data_type: Union[DataType, GenericDataType] = Field(
         None,
+        discriminator='type',
         description='Optional DataType from the ladybug datatype subpackage (ie. '
         'Temperature()) , which will be used to assign default legend properties. '
         'If None, the legend associated with this object will contain no units '
         'unless a unit below is specified.'
     )
 
-    unit: str = Field(
+    unit: InternedStr = Field(
         '',
         description='Optional text string for the units of the values. (ie. "C"). '
         'If None, the default units of the data_type will be used.'
     )
 
-    user_data: dict = Field(
-        default=None,
-        description='Optional dictionary of user data associated with the object.'
-        'All keys and values of this dictionary should be of a standard data '
-        'type to ensure correct serialization of the object (eg. str, float, '
-        'int, list).'
-    )
+    user_data: UserData = USER_DATA_FIELD
 
 
 class VisualizationMetaData(NoExtraBaseModel):
     """Represents the visualization metadata that can be assigned to VisualizationData.
     """
 
-    type: constr(regex='^VisualizationMetaData$') = 'VisualizationMetaData'
+    type: Literal['VisualizationMetaData'] = 'VisualizationMetaData'
 
     legend_parameters: LegendParameters = Field(
         None,
@@ -449,25 +575,20 @@ class VisualizationMetaData(NoExtraBaseModel):
 
     data_type: Union[DataType, GenericDataType] = Field(
         None,
+        discriminator='type',
         description='Optional DataType from the ladybug datatype subpackage (ie. '
         'Temperature()) , which will be used to assign default legend properties. '
         'If None, the legend associated with this object will contain no units '
         'unless a unit below is specified.'
     )
 
-    unit: str = Field(
+    unit: InternedStr = Field(
         '',
         description='Optional text string for the units of the values. (ie. "C"). '
         'If None, the default units of the data_type will be used.'
     )
 
-    user_data: dict = Field(
-        default=None,
-        description='Optional dictionary of user data associated with the object.'
-        'All keys and values of this dictionary should be of a standard data '
-        'type to ensure correct serialization of the object (eg. str, float, '
-        'int, list).'
-    )
+    user_data: UserData = USER_DATA_FIELD
 
 
 class _VisualizationBase(NoExtraBaseModel):
@@ -475,14 +596,14 @@ class _VisualizationBase(NoExtraBaseModel):
 
     identifier: str = Field(
         ...,
-        regex=r'^[.A-Za-z0-9_-]+$',
-        min_length=1,
-        max_length=100,
+        # the 1-100 length bounds live in the pattern so each identifier
+        # is checked in a single regex pass
+        regex=r'^[.A-Za-z0-9_-]{1,100}$',
         description='Text string for a unique object ID. Must be less than 100 '
         'characters and not contain spaces or special characters.'
     )
 
-    display_name: str = Field(
+    display_name: InternedStr = Field(
         default=None,
         description='Display name of the object with no character restrictions. '
         'This is typically used to set the layer of the object in the interface that '
@@ -491,19 +612,13 @@ class _VisualizationBase(NoExtraBaseModel):
         'the display_name will be equal to the object identifier.'
     )
 
-    user_data: dict = Field(
-        default=None,
-        description='Optional dictionary of user data associated with the object.'
-        'All keys and values of this dictionary should be of a standard data '
-        'type to ensure correct serialization of the object (eg. str, float, '
-        'int, list).'
-    )
+    user_data: UserData = USER_DATA_FIELD
 
 
 class AnalysisGeometry(_VisualizationBase):
     """An object where multiple data streams correspond to the same geometry."""
 
-    type: constr(regex='^AnalysisGeometry$') = 'AnalysisGeometry'
+    type: Literal['AnalysisGeometry'] = 'AnalysisGeometry'
 
     geometry: List[GEOMETRY_UNION] = Field(
         ...,
@@ -522,17 +637,13 @@ class AnalysisGeometry(_VisualizationBase):
         'that are associated with the input geometry.'
     )
 
-    active_data: int = Field(
+    active_data: _NON_NEG_INT = Field(
         0,
         description='An integer to denote which of the input data_sets should be '
         'displayed by default.'
     )
 
-    display_mode: DisplayModes = Field(
-        DisplayModes.surface,
-        description='Text to indicate the display mode (surface, wireframe, '
-        'etc.). The DisplayModes enumeration contains all acceptable types.'
-    )
+    display_mode: DisplayModes = DISPLAY_MODE_FIELD
 
     hidden: bool = Field(
         False,
@@ -540,32 +651,84 @@ class AnalysisGeometry(_VisualizationBase):
         'and must be un-hidden to be visible in the 3D scene.'
     )
 
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def check_values_align(cls, obj_props):
         """Check that values and geometry align."""
-        data_sets, geos = obj_props.get('data_sets'), obj_props.get('geometry')
-        geo_count_0, geo_count_1, geo_count_2 = len(geos), 0, 0
-        for geo in geos:
-            if isinstance(geo, (Mesh2D, Mesh3D)):
-                geo_count_1 += len(geo.faces)
-                geo_count_2 += len(geo.vertices)
-        possible_lens = (geo_count_0, geo_count_1, geo_count_2)
-        assert len(data_sets[0].values) in possible_lens, 'Expected number of values' \
-            ' ({}) to align with the number of geometries ({}), the number of ' \
-            'mesh faces ({}), or the number of mesh vertices ({}).'.format(
-                len(data_sets[0].values), geo_count_0, geo_count_1, geo_count_2)
-        ref_len = len(data_sets[0].values)
+        data_sets, geos = obj_props['data_sets'], obj_props['geometry']
+        ref_len, geo_count_0 = len(data_sets[0].values), len(geos)
+        if ref_len != geo_count_0:  # only walk the meshes when counts don't align
+            geo_count_1, geo_count_2 = 0, 0
+            for geo in geos:
+                if geo.type in _MESH_TYPES:
+                    geo_count_1 += len(geo.faces)
+                    geo_count_2 += len(geo.vertices)
+            if ref_len != geo_count_1 and ref_len != geo_count_2:
+                raise ValueError(
+                    f'Expected number of values ({ref_len}) to align with the '
+                    f'number of geometries ({geo_count_0}), the number of mesh '
+                    f'faces ({geo_count_1}), or the number of mesh '
+                    f'vertices ({geo_count_2}).'
+                )
         for data in data_sets[1:]:
-            assert len(data.values) == ref_len, 'Expected all data sets of ' \
-                'AnalysisGeometry to have the same length. {} != {}.'.format(
-                    len(data.values), ref_len)
+            if len(data.values) != ref_len:
+                raise ValueError(
+                    'Expected all data sets of AnalysisGeometry to have the '
+                    f'same length. {len(data.values)} != {ref_len}.'
+                )
+        active_data = obj_props.get('active_data') or 0
+        if active_data >= len(data_sets):
+            raise ValueError(
+                f'active_data index ({active_data}) must be less than the '
+                f'number of data_sets ({len(data_sets)}).'
+            )
         return obj_props
 
+    @classmethod
+    def from_matrix(cls, identifier, geometry, values_matrix,
+                    legend_parameters=None, data_types=None, units=None,
+                    **kwargs):
+        """Build an AnalysisGeometry from rows of trusted values without validation.
+
+        This is the batch counterpart to from_trusted_dict for callers that
+        compute many aligned data sets over the same geometry (eg. hourly
+        results). Each row of the matrix becomes one VisualizationData built
+        with construct, so pydantic never walks the value lists and the legend
+        parameter and data type objects are shared by reference rather than
+        copied per data set. No checks are performed, so the rows must already
+        be equal-length lists of floats that align with the geometry.
+
+        Args:
+            identifier: Text string for a unique object ID.
+            geometry: A list of already-validated geometry objects.
+            values_matrix: A list of rows with one row of values per data set.
+            legend_parameters: Optional list of LegendParameters that aligns
+                with the rows of the matrix.
+            data_types: Optional list of DataType objects that aligns with
+                the rows of the matrix.
+            units: Optional list of unit strings that aligns with the rows
+                of the matrix.
+            **kwargs: Any other AnalysisGeometry fields (eg. active_data).
+        """
+        data_sets = [
+            VisualizationData.construct(
+                values=row,
+                legend_parameters=legend_parameters[i]
+                if legend_parameters is not None else None,
+                data_type=data_types[i] if data_types is not None else None,
+                unit=units[i] if units is not None else ''
+            )
+            for i, row in enumerate(values_matrix)
+        ]
+        return cls.construct(
+            identifier=identifier, geometry=geometry, data_sets=data_sets,
+            **kwargs
+        )
+
 
 class ContextGeometry(_VisualizationBase):
     """An object representing context geometry to display."""
 
-    type: constr(regex='^ContextGeometry$') = 'ContextGeometry'
+    type: Literal['ContextGeometry'] = 'ContextGeometry'
 
     geometry: List[DISPLAY_UNION] = Field(
         ...,
@@ -594,9 +757,13 @@ class Units(str, Enum):
 class VisualizationSet(_VisualizationBase):
     """A visualization set containing analysis and context geometry to be visualized."""
 
-    type: constr(regex='^VisualizationSet$') = 'VisualizationSet'
+    type: Literal['VisualizationSet'] = 'VisualizationSet'
 
-    geometry: List[Union[AnalysisGeometry, ContextGeometry]] = Field(
+    geometry: List[
+        Annotated[
+            Union[AnalysisGeometry, ContextGeometry], Field(discriminator='type')
+        ]
+    ] = Field(
         None,
         description='A list of AnalysisGeometry and ContextGeometry objects to '
         'display in the visualization. Each geometry object will typically be '
@@ -94,6 +94,15 @@ def test_mesh_3d():
     Mesh3D.parse_file(file_path)
 
 
+def test_mesh_3d_color_sequences():
+    mesh = Mesh3D(
+        vertices=[[0, 0, 0], [1, 0, 0], [1, 1, 0]], faces=[[0, 1, 2]],
+        colors=[(255, 0, 0), (0, 255, 0, 128), (0, 0, 255)]
+    )
+    assert all(color.type == 'Color' for color in mesh.colors)
+    assert mesh.colors[1].a == 128
+
+
 def test_polyface_3d():
     file_path = os.path.join(target_folder, 'polyface_3d.json')
     Polyface3D.parse_file(file_path)
@@ -1,5 +1,11 @@
 import os
-from ladybug_display_schema.visualization import VisualizationSet
+import json
+import base64
+import struct
+import pytest
+from pydantic import ValidationError
+from ladybug_display_schema.visualization import VisualizationSet, \
+    VisualizationData
 
 # target folder where all of the samples live
 root = os.path.dirname(os.path.dirname(__file__))
@@ -59,3 +65,33 @@ def test_visualization_set_wind_rose():
 def test_visualization_set_hourly_plot():
     file_path = os.path.join(target_folder, 'hourly_plot.vsf')
     VisualizationSet.parse_file(file_path)
+
+
+def test_visualization_set_from_trusted_dict():
+    file_path = os.path.join(target_folder, 'detailed_vis.vsf')
+    vis_set = VisualizationSet.parse_file(file_path)
+    with open(file_path) as json_file:
+        data = json.load(json_file)
+    assert VisualizationSet.from_trusted_dict(data) == vis_set
+
+
+def test_visualization_data_values_b64():
+    values = [0.0, 1.5, -2.25]
+    for dtype, fmt in (('f8', 'd'), ('f4', 'f')):
+        values_b64 = base64.b64encode(
+            struct.pack('<{}{}'.format(len(values), fmt), *values)).decode()
+        data = VisualizationData(values_b64=values_b64, values_dtype=dtype)
+        assert data.values == values
+        assert data.values_b64 is None
+    with pytest.raises(ValidationError):  # 12 bytes is not a multiple of 8
+        VisualizationData(values_b64=base64.b64encode(bytes(12)).decode())
+    with pytest.raises(ValidationError):  # both forms of the values
+        VisualizationData(values=values, values_b64=values_b64)
+    with pytest.raises(ValidationError):  # neither form of the values
+        VisualizationData()
+
+
+def test_visualization_set_from_trusted_file():
+    file_path = os.path.join(target_folder, 'detailed_vis.vsf')
+    vis_set = VisualizationSet.parse_file(file_path)
+    assert VisualizationSet.from_trusted_file(file_path) == vis_set